@@ -1,12 +1,15 @@
 import abc
+import array
 import builtins
 import collections
 import contextlib
 import functools
 import inspect
 import itertools
+import operator
 import types
 import typing
+import weakref
 from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any, Self, TypeVar, Union, get_type_hints
 
@@ -31,32 +34,62 @@ def common_bases(*bases):
     return tuple(cls for cls in counts if counts[cls] == len(bases))
 
 
+def minimal(keys: set) -> set:
+    """Return signatures which have no more specific signature in the set."""
+    return {key for key in keys if not any(key != other and key.subtypes(*other) for other in keys)}
+
+
+def cached(func: Callable, maxsize: int | None) -> Callable:
+    """Return `func` memoized with `functools.lru_cache`, and called directly if unhashable."""
+    memo = functools.lru_cache(maxsize, typed=True)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return memo(*args, **kwargs)
+        except TypeError as ex:
+            if ex.__traceback__.tb_next is not None:  # raised by the function itself
+                raise
+        return memo.__wrapped__(*args, **kwargs)
+
+    wrapper.cache_info, wrapper.cache_clear = memo.cache_info, memo.cache_clear
+    return wrapper
+
+
 class subtype(abc.ABCMeta):
     """A normalized generic type which checks subscripts.
 
     Transforms a generic alias into a concrete type which supports `issubclass` and `isinstance`.
     If the type ends up being equivalent to a builtin, the builtin is returned.
+    Options `depth` and `memo` configure container checks, and are part of the interned identity.
     """
 
     __origin__: type
     __args__: tuple
+    depth: int | None = 1  # number of container elements to check, or None for all
+    memo: int = 0  # number of immutable containers to memoize checks of
+    interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    __hashed__: int | None = None
 
-    def __new__(cls, tp):
+    def __new__(cls, tp, depth: int | None = 1, memo: int = 0):
         match tp:
             case typing.Any:
                 return object
             case typing.NewType():
-                return cls(tp.__supertype__)
+                return cls(tp.__supertype__, depth, memo)
             case TypeVar():
-                return cls(Union[tp.__constraints__]) if tp.__constraints__ else object
+                return cls(Union[tp.__constraints__], depth, memo) if tp.__constraints__ else object
             case typing._AnnotatedAlias():
-                return cls(tp.__origin__)
+                return cls(tp.__origin__, depth, memo)
             case TypeAliasType():
-                return cls(tp.__value__)
+                return cls(tp.__value__, depth, memo)
             case type():
                 return tp
         origin = get_origin(tp) or tp
-        args = tuple(map(cls, get_args(tp)))
+        if origin in (typing.Union, types.UnionType):  # options apply to the members
+            args = tuple(cls(arg, depth, memo) for arg in get_args(tp))
+        else:
+            args = tuple(map(cls, get_args(tp)))
         if not args and origin is not tuple:
             return origin
         bases = (origin,)
@@ -73,19 +106,60 @@ class subtype(abc.ABCMeta):
                 (arg,) = typing.get_args(tp)
                 if isinstance(arg, typing.NewType):
                     origin, args = typing.NewType, (arg,)
-        namespace = {"__origin__": origin, "__args__": args}
-        return type.__new__(cls, str(tp), bases, namespace)
+        namespace = {"__origin__": origin, "__args__": args, "__checks__": {}}
+        namespace["__classes__"] = None  # memoized checks of other classes, not inherited
+        namespace.update(depth=depth, memo=memo)
+        try:  # literal values of different types are distinct, as are options
+            key = cls, origin, args, tuple(map(type, args)), depth, memo
+            namespace["__hashed__"] = hash((origin, *args, depth, memo))
+        except TypeError:  # unhashable literal values are not interned
+            key = None
+        if key is not None and (self := cls.interned.get(key)):
+            return self
+        self = type.__new__(cls, str(tp), bases, namespace)
+        self.__predicate__ = self.predicate()
+        return self if key is None else cls.interned.setdefault(key, self)
+
+    def __init__(self, *_, **__): ...
+
+    def __setattr__(self, name: str, value):
+        if name in ("depth", "memo"):
+            raise AttributeError(f"{name} is set on construction, since subtypes are interned")
+        super().__setattr__(name, value)
 
     def key(self) -> tuple:
-        return self.__origin__, *self.__args__
+        return self.__origin__, self.__args__, self.depth, self.memo
 
     def __eq__(self, other) -> bool:
         return isinstance(other, subtype) and self.key() == other.key()
 
     def __hash__(self):
-        return hash(self.key())
+        return self.__hashed__ or hash(self.key())
 
     def __subclasscheck__(self, subclass):
+        token = abc.get_cache_token()
+        if not isinstance(subclass, subtype):  # shared by all multimethods, and weakly referenced
+            with contextlib.suppress(KeyError, TypeError):
+                cached, result = self.__classes__[subclass]  # type: ignore
+                if cached == token:
+                    return result
+            result = self.subclasscheck(subclass)
+            if self.__classes__ is None:
+                self.__classes__ = weakref.WeakKeyDictionary()
+            with contextlib.suppress(TypeError):
+                self.__classes__[subclass] = token, result
+            return result
+        try:  # memoized checks are owned by the subclass, and replaced when the token changes
+            cached, result = subclass.__checks__.get(self, (None, None))
+        except TypeError:  # unhashable literal values
+            return self.subclasscheck(subclass)
+        if cached != token:
+            result = self.subclasscheck(subclass)
+            subclass.__checks__[self] = token, result
+        return result
+
+    def subclasscheck(self, subclass) -> bool:
+        """Uncached `issubclass`."""
         args = get_args(subclass)
         match origin := get_origin(subclass):
             case None:
@@ -120,36 +194,90 @@ class subtype(abc.ABCMeta):
         )
 
     def __instancecheck__(self, instance):
-        match self.__origin__:
+        return self.__predicate__(instance)
+
+    def predicate(self) -> Callable[[object], bool]:
+        """Return an `isinstance` check specialized to the shape of the type.
+
+        Built once per type, including its `depth` and `memo` options.
+        """
+        origin, args = self.__origin__, self.__args__
+        match origin:
             case typing.Literal:
-                return any(type(arg) is type(instance) and arg == instance for arg in self.__args__)
+                return lambda instance: any(
+                    type(arg) is type(instance) and arg == instance for arg in args
+                )
             case types.UnionType:
-                return isinstance(instance, self.__args__)
+                return lambda instance: isinstance(instance, args)
             case builtins.type:
-                try:
-                    return issubclass(subtype(instance), self.__args__)
-                except TypeError:
-                    return False
+
+                def check(instance):
+                    try:
+                        return issubclass(subtype(instance), args)
+                    except TypeError:
+                        return False
+
+                return check
             case typing.NewType:
-                return isinstance(instance, typing.NewType) and (
-                    instance in self.__args__ or isinstance(instance.__supertype__, self)
+                return lambda instance: isinstance(instance, typing.NewType) and (
+                    instance in args or isinstance(instance.__supertype__, self)
                 )
-        if isinstance(instance, typing.Generic):  # user-defined generic type
-            return issubclass(getattr(instance, "__orig_class__", type(instance)), self)
-        if not isinstance(instance, self.__origin__) or isinstance(instance, Iterator):
-            return False
-        if self.__origin__ is Callable:
-            hints = get_type_hints(instance)
-            args = [hints.get(name, object) for name in inspect.signature(instance).parameters]
-            return issubclass(Callable[args, hints.get("return", object)], self)
-        if self.__origin__ is tuple and ... not in self.__args__:
-            if len(instance) != len(self.__args__):
+            case collections.abc.Callable:
+
+                def contents(instance):
+                    hints = get_type_hints(instance)
+                    names = inspect.signature(instance).parameters
+                    params = [hints.get(name, object) for name in names]
+                    return issubclass(Callable[params, hints.get("return", object)], self)
+
+            case builtins.tuple if ... not in args:
+
+                def contents(instance):
+                    return len(instance) == len(args) and all(map(isinstance, instance, args))
+
+            case _ if issubclass(origin, Mapping):
+
+                def contents(instance):
+                    items = itertools.islice(instance.items(), self.depth)
+                    return all(all(map(isinstance, item, args)) for item in items)
+
+            case _ if any(type(arg) not in (type, types.EllipsisType) for arg in args):
+                contents = functools.partial(subtype.elements, self)  # nested checks may change
+            case _:
+                contents = functools.partial(subtype.memoized, self)
+        exact = not issubclass(origin, (typing.Generic, Iterator))  # instances of origin skip those
+
+        def check(instance):
+            if exact and type(instance) is origin:
+                return contents(instance)
+            if isinstance(instance, typing.Generic):  # user-defined generic type
+                return issubclass(getattr(instance, "__orig_class__", type(instance)), self)
+            if not isinstance(instance, origin):
                 return False
-        elif issubclass(self, Mapping):
-            instance = next(iter(instance.items()), ())
-        else:
-            instance = itertools.islice(instance, 1)
-        return all(map(isinstance, instance, self.__args__))
+            if isinstance(instance, Iterator):  # only peekable iterators can be checked
+                return isinstance(instance, peekable) and subtype.elements(self, instance.head)
+            return contents(instance)
+
+        return check
+
+    def memoized(self, instance) -> bool:
+        """Check container elements, memoized for immutable containers if enabled."""
+        if not self.memo or type(instance) not in (tuple, frozenset):
+            return subtype.elements(self, instance)
+        if "memos" not in vars(self):
+            self.memos = {}
+        with contextlib.suppress(KeyError):
+            return self.memos[id(instance)][1]
+        if len(self.memos) >= self.memo:
+            self.memos.pop(next(iter(self.memos)), None)
+        result = subtype.elements(self, instance)
+        self.memos[id(instance)] = instance, result  # the reference keeps the id unique
+        return result
+
+    def elements(self, instance) -> bool:
+        """Check container elements up to `depth`."""
+        values = itertools.islice(instance, self.depth)
+        return all(map(isinstance, values, itertools.repeat(self.__args__[0])))
 
     @functools.singledispatch
     def origins(self) -> Iterable[type]:
@@ -169,6 +297,26 @@ class subtype(abc.ABCMeta):
                 yield origin
 
 
+class peekable(Iterator):
+    """An iterator which supports instance checks on its first element.
+
+    The first element is read eagerly, and chained back on for iteration.
+    """
+
+    def __init__(self, values: Iterable):
+        it = iter(values)
+        self.head = tuple(itertools.islice(it, 1))
+        self.it = itertools.chain(self.head, it)
+
+    def __next__(self):
+        return next(self.it)
+
+    @classmethod
+    def wrap(cls, arg):
+        """Return a peekable iterator, or the original argument if peekable or not an iterator."""
+        return arg if isinstance(arg, peekable) or not isinstance(arg, Iterator) else cls(arg)
+
+
 class parametric(abc.ABCMeta):
     """A type which further customizes `issubclass` and `isinstance` beyond the base type.
 
@@ -253,6 +401,21 @@ class signature(tuple):
         return self.required <= len(args) and all(map(isinstance, args, self))
 
 
+class typecache(dict):
+    """A cache keyed by tuples of types which are only weakly referenced.
+
+    Entries are removed as soon as any of their types is garbage collected.
+    """
+
+    def __getitem__(self, types: tuple) -> Callable:
+        return super().__getitem__(tuple(map(id, types)))[1]
+
+    def __setitem__(self, types: tuple, func: Callable):
+        key = tuple(map(id, types))
+        refs = [weakref.ref(cls, lambda _: self.pop(key, None)) for cls in types]
+        super().__setitem__(key, (refs, func))
+
+
 REGISTERED = TypeVar("REGISTERED", bound=Callable[..., Any])
 
 
@@ -262,6 +425,12 @@ class multimethod(dict):
     __name__: str
     pending: set
     generics: list[tuple]  # positional bases which require instance checks
+    weak: bool = False  # cache dispatched types with weak references
+    peek: bool = False  # dispatch on the first element of iterators
+    base: "multimethod | None" = None  # resolves types which don't match own signatures
+    generation: int = 0  # incremented whenever the cache is emptied
+    direct: Callable | None = None  # the only function, if it matches all arguments
+    memo: Callable | None = None  # decorator applied to registered functions
 
     def __new__(cls, func):
         homonym = inspect.currentframe().f_back.f_locals.get(func.__name__)
@@ -278,6 +447,7 @@ class multimethod(dict):
             self[signature.from_hints(func)] = func
         except (NameError, AttributeError):
             self.pending.add(func)
+            self.direct = None
 
     @typing.overload
     def register(self, __func: REGISTERED) -> REGISTERED: ...
@@ -296,24 +466,73 @@ class multimethod(dict):
         return lambda func: self.__setitem__(args, func) or func
 
     def __get__(self, instance, owner):
-        return self if instance is None else types.MethodType(self, instance)
+        return self if instance is None else types.MethodType(self.direct or self, instance)
 
     def parents(self, types: tuple) -> set:
         """Find immediate parents of potential key."""
+        if self.base is not None:
+            return minimal({key for key in self.registered() if key.subtypes(*types)} - {types})
         parents = {key for key in list(self) if isinstance(key, signature) and key.subtypes(*types)}
         parents.discard(types)
         return parents - {ancestor for parent in parents for ancestor in parent.parents}
 
     def clean(self):
-        """Empty the cache."""
+        """Empty the cache, including of any layers."""
+        self.generation += 1
         for key in list(self):
             if not isinstance(key, signature):
                 super().__delitem__(key)
+        self.__dict__.pop("refs", None)
+        self.__dict__.pop("errors", None)
+        self.__dict__.pop("arity", None)
+        for layer in list(self.__dict__.get("layers", {}).values()):
+            layer.clean()
+
+    @functools.cached_property
+    def refs(self) -> typecache:
+        """weak cache of dispatched types, if enabled"""
+        return typecache()
+
+    @functools.cached_property
+    def errors(self) -> dict:
+        """cache of failed dispatches"""
+        return typecache() if self.weak else {}
+
+    @functools.cached_property
+    def arity(self) -> int:
+        """number of leading positions which any signature dispatches on"""
+        return max(map(len, self.registered()), default=0)
+
+    @functools.cached_property
+    def layers(self) -> weakref.WeakValueDictionary:
+        """multimethods which extend this one"""
+        return weakref.WeakValueDictionary()
 
     def copy(self):
         """Return a new multimethod with the same methods."""
         return dict.__new__(type(self)).__ior__(self)
 
+    def layer(self) -> Self:
+        """Return a new multimethod which overlays registrations on this one.
+
+        Types which don't match any of the layer's own signatures reuse the resolutions of the base.
+        Later changes to the base are visible in the layer, which starts with the same options.
+        """
+        layer = functools.update_wrapper(dict.__new__(type(self)), self, updated=())
+        layer.pending, layer.generics, layer.base = set(), list(self.generics), self
+        layer.weak, layer.peek, layer.memo = self.weak, self.peek, self.memo
+        self.layers[id(layer)] = layer
+        return layer
+
+    def registered(self) -> dict[signature, Callable]:
+        """Return registered functions, including those of the base which aren't overridden."""
+        self.evaluate()
+        funcs = {key: func for key, func in list(self.items()) if isinstance(key, signature)}
+        if self.base is not None:
+            for key, func in self.base.registered().items():
+                funcs.setdefault(key, func)
+        return funcs
+
     def __setitem__(self, types: tuple, func: Callable):
         self.clean()
         if not isinstance(types, signature):
@@ -321,17 +540,17 @@ class multimethod(dict):
         parents = types.parents = self.parents(types)
         with contextlib.suppress(ValueError):
             types.sig = inspect.signature(func)
+        if self.memo and not hasattr(func, "cache_clear"):
+            func = self.memo(func)
         self.pop(types, None)  # ensure key is overwritten
         for key in self:
             if types.subtypes(*key) and (not parents or parents & key.parents):
                 key.parents -= parents
                 key.parents.add(types)
-        for index, cls in enumerate(types):
-            if origins := set(subtype.origins(cls)):
-                self.generics += [()] * (index + 1 - len(self.generics))
-                self.generics[index] = tuple(origins.union(self.generics[index]))
+        self.mark(types)
         super().__setitem__(types, func)
         self.__doc__ = self.docstring
+        self.direct = self.trivial()
 
     def __delitem__(self, types: tuple):
         self.clean()
@@ -340,44 +559,150 @@ class multimethod(dict):
             if types in key.parents:
                 key.parents = self.parents(key)
         self.__doc__ = self.docstring
+        self.direct = self.trivial()
+
+    def mark(self, types: tuple):
+        """Mark positions which require instance checks, including in layers."""
+        for index, cls in enumerate(types):
+            if origins := set(subtype.origins(cls)):
+                self.generics += [()] * (index + 1 - len(self.generics))
+                self.generics[index] = tuple(origins.union(self.generics[index]))
+        for layer in list(self.__dict__.get("layers", {}).values()):
+            layer.mark(types)
+
+    def peeked(self, args: tuple) -> tuple:
+        """Wrap iterators in positions which check the elements of iterables."""
+        wraps = [any(issubclass(Iterator, cls) for cls in bases) for bases in self.generics]
+        peeked = (peekable.wrap(arg) if wrap else arg for arg, wrap in zip(args, wraps))
+        return (*peeked, *args[len(wraps) :])
+
+    def trivial(self) -> Callable | None:
+        """Return the only function if it matches all arguments, so dispatch is unnecessary."""
+        if len(self) == 1 and not self.pending and self.base is None:
+            ((key, func),) = self.items()
+            return func if all(cls is object for cls in key) else None
+        return None
 
     def select(self, types: tuple, keys: set[signature]) -> Callable:
         keys = {key for key in keys if key.callable(*types)}
-        funcs = {self[key] for key in keys}
+        funcs = {self[key] if key in self else self.base[key] for key in keys}  # type: ignore
         if len(funcs) == 1:
             return funcs.pop()
         raise DispatchError(f"{self.__name__}: {len(keys)} methods found", types, keys)
 
+    def find(self, types: tuple) -> Callable:
+        """Find the next applicable method of given types."""
+        if self.base is None:
+            return self.select(types, self.parents(types))
+        if any(isinstance(key, signature) and key.subtypes(*types) for key in list(self)):
+            keys = {key for key in self.registered() if key.subtypes(*types)}
+            return self.select(types, minimal(keys))  # an exact match is minimal
+        return self.base[types]
+
     def __missing__(self, types: tuple) -> Callable:
-        """Find and cache the next applicable method of given types."""
+        """Find and cache the next applicable method of given types, or failure to find one."""
         self.evaluate()
         types = tuple(map(subtype, types))
         if types in self:
             return self[types]
-        return self.setdefault(types, self.select(types, self.parents(types)))
+        if self.weak:
+            with contextlib.suppress(KeyError):
+                return self.refs[types]
+        with contextlib.suppress(KeyError):
+            message, keys = self.errors[types]
+            raise DispatchError(message, types, keys)
+        try:
+            func = self.find(types)
+        except DispatchError as error:
+            message, _, keys = error.args
+            self.errors[types] = message, keys
+            raise
+        if not self.weak:
+            return self.setdefault(types, func)
+        self.refs[types] = func
+        return func
+
+    def memoize(self, *types, maxsize: int | None = 128):
+        """Memoize results of the function registered with types, or of all functions by default.
+
+        Results are cached by argument values with `functools.lru_cache`.
+        If no types are given, functions registered later are also memoized.
+        """
+        decorator = functools.partial(cached, maxsize=maxsize)
+        funcs = self.registered()
+        if types:
+            keys = [key for key in funcs if key == signature(types)]
+            if not keys:
+                raise KeyError(f"{self.__name__}: no function registered with {types}")
+        else:
+            self.memo = decorator
+            keys = [key for key in funcs if key in self]
+        for key in keys:  # copies keep the required arity, without modifying a base
+            if not hasattr(funcs[key], "cache_clear"):
+                self[signature(key, key.required)] = decorator(funcs[key])
+
+    def cache_info(self) -> dict:
+        """Return statistics of memoized functions by signature."""
+        funcs = self.registered().items()
+        return {key: func.cache_info() for key, func in funcs if hasattr(func, "cache_info")}
+
+    def cache_clear(self):
+        """Empty the dispatch cache and the results of memoized functions."""
+        self.clean()
+        for func in self.registered().values():
+            if hasattr(func, "cache_clear"):
+                func.cache_clear()
+
+    def resolve(self, *types) -> "resolution":
+        """Return a callable handle of the method resolved by types, as with `self[types]`.
+
+        The handle is revalidated whenever functions are registered or removed.
+        """
+        return resolution(self, types)
+
+    def compile_table(self, classes: Iterable[type]) -> "table":
+        """Return a callable which dispatches on a closed set of classes by indexing.
+
+        All combinations are resolved in advance, without filling the cache.
+        The table is rebuilt whenever functions are registered or removed.
+        """
+        return table(self, classes)
 
     def dispatch(self, *args) -> Callable:
-        self.evaluate()
+        if self.pending or self.base is not None:
+            self.evaluate()
         types = tuple(map(type, args))
-        if not any(map(issubclass, types, self.generics)):
+        if len(types) > self.arity:  # trailing types only matter for arity
+            types = types[: self.arity] + (object,) * (len(types) - self.arity)
+        if not self.generics or not any(map(issubclass, types, self.generics)):
+            if self.weak:  # hits bypass the subtype conversion of `__missing__`
+                with contextlib.suppress(KeyError):
+                    return self.refs[types]
             return self[types]
+        if self.base is not None:
+            keys = {key for key in self.registered() if key.instances(*args)}
+            return self.select(types, minimal(keys))
         matches = {key for key in list(self) if isinstance(key, signature) and key.instances(*args)}
         matches -= {ancestor for match in matches for ancestor in match.parents}
         return self.select(types, matches)
 
     def __call__(self, *args, **kwargs):
         """Resolve and dispatch to best method."""
-        func = self.dispatch(*args)
+        if self.peek:
+            args = self.peeked(args)
+        func = self.direct or self.dispatch(*args)
         try:
             return func(*args, **kwargs)
         except TypeError as ex:
-            raise DispatchError(f"Function {func.__code__}") from ex
+            raise DispatchError(f"Function {inspect.unwrap(func).__code__}") from ex
 
     def evaluate(self):
         """Evaluate any pending forward references."""
         while self.pending:
             func = self.pending.pop()
             self[signature.from_hints(func)] = func
+        if self.base is not None:
+            self.base.evaluate()
 
     @property
     def docstring(self):
@@ -390,6 +715,70 @@ class multimethod(dict):
         return "\n\n".join(docs)
 
 
+class resolution:
+    """A resolved method of a multimethod, which is resolved again when the multimethod changes."""
+
+    __slots__ = ("method", "types", "generation", "func")
+
+    def __init__(self, method: multimethod, types: tuple):
+        self.method, self.types = method, types
+        generation = method.generation  # only updated once resolved
+        self.func, self.generation = method[types], generation
+
+    def __call__(self, *args, **kwargs):
+        if self.generation != self.method.generation:
+            self.__init__(self.method, self.types)
+        return self.func(*args, **kwargs)
+
+
+class table:
+    """A dense dispatch table of a multimethod for a closed set of classes.
+
+    Classes are assigned integer ids, and each combination indexes an array of functions.
+    Other classes, instance checks, and keyword arguments fall back to the multimethod.
+    """
+
+    __slots__ = ("method", "classes", "ids", "strides", "funcs", "indices", "generation")
+
+    def __init__(self, method: multimethod, classes: Iterable[type]):
+        classes = tuple(dict.fromkeys(classes))
+        arity = method.arity  # also evaluates pending functions
+        generation = method.generation  # only updated once rebuilt
+        funcs: dict = {None: 0}  # the fallback
+        indices = []
+        for types in itertools.product(classes, repeat=arity):
+            func = None
+            if not any(map(issubclass, types, method.generics)) and not (
+                method.peek and any(issubclass(cls, Iterator) for cls in types)
+            ):
+                with contextlib.suppress(DispatchError):  # errors are raised by the fallback
+                    func = method[types] if types in method else method.find(types)
+            indices.append(funcs.setdefault(func, len(funcs)))
+        self.method, self.classes = method, classes
+        self.ids = {cls: index for index, cls in enumerate(classes)}
+        self.strides = [len(classes) ** index for index in reversed(range(arity))]
+        self.funcs = list(funcs)
+        self.indices = array.array("H" if len(funcs) <= 0xFFFF else "L", indices)
+        self.generation = generation
+
+    def __call__(self, *args, **kwargs):
+        if self.generation != self.method.generation:
+            self.__init__(self.method, self.classes)
+        func = None
+        if len(args) == len(self.strides) and not kwargs:
+            try:
+                ids = map(self.ids.__getitem__, map(type, args))
+                func = self.funcs[self.indices[sum(map(operator.mul, ids, self.strides))]]
+            except KeyError:  # unknown classes
+                pass
+        if func is None:
+            return self.method(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except TypeError as ex:
+            raise DispatchError(f"Function {inspect.unwrap(func).__code__}") from ex
+
+
 RETURN = TypeVar("RETURN")
 
 
@@ -400,7 +789,7 @@ class multidispatch(multimethod, dict[tuple[type, ...], Callable[..., RETURN]]):
     Allows dispatching on keyword arguments based on the first function signature.
     """
 
-    signatures: dict[tuple, inspect.Signature]
+    signatures: typing.MutableMapping[tuple, inspect.Signature]
 
     def __new__(cls, func: Callable[..., RETURN]) -> "multidispatch[RETURN]":
         return functools.update_wrapper(dict.__new__(cls), func)  # type: ignore
@@ -412,7 +801,12 @@ class multidispatch(multimethod, dict[tuple[type, ...], Callable[..., RETURN]]):
         self[()] = func
 
     def __get__(self, instance, owner) -> Callable[..., RETURN]:
-        return self if instance is None else types.MethodType(self, instance)
+        return self if instance is None else types.MethodType(self.direct or self, instance)
+
+    def layer(self) -> Self:
+        layer = super().layer()
+        layer.signatures = collections.ChainMap({}, self.signatures)  # reads through to the base
+        return layer
 
     def __setitem__(self, types: tuple, func: Callable):
         super().__setitem__(types, func)
@@ -422,12 +816,19 @@ class multidispatch(multimethod, dict[tuple[type, ...], Callable[..., RETURN]]):
 
     def __call__(self, *args: Any, **kwargs: Any) -> RETURN:
         """Resolve and dispatch to best method."""
-        params = args
+        if self.direct:
+            return self.direct(*args, **kwargs)
+        params, names = args, ()
         if kwargs:
             for signature in self.signatures.values():  # pragma: no branch
                 with contextlib.suppress(TypeError):
                     params = signature.bind(*args, **kwargs).args
+                    names = tuple(signature.parameters)
                     break
+        if self.peek:  # keywords are wrapped by position
+            params = self.peeked(params)
+            kwargs.update(zip(names[len(args) : len(params)], params[len(args) :]))
+            args = params[: len(args)]
         func = self.dispatch(*params)
         return func(*args, **kwargs)
 
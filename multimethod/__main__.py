@@ -0,0 +1,124 @@
+"""Audit the multimethods of a module: `python -m multimethod <module>`."""
+
+import argparse
+import contextlib
+import importlib
+import itertools
+import timeit
+from collections.abc import Callable, Iterator
+
+from . import DispatchError, multimethod, signature
+
+
+def find(module) -> Iterator[tuple[str, multimethod]]:
+    """Generate named multimethods of a module, including in its classes."""
+    seen = set()
+    for name, value in vars(module).items():
+        items = [(name, value)]
+        if isinstance(value, type) and value.__module__ == module.__name__:
+            items += [(f"{name}.{attr}", method) for attr, method in vars(value).items()]
+        for name, method in items:
+            if isinstance(method, multimethod) and id(method) not in seen:
+                seen.add(id(method))
+                yield name, method
+
+
+def meet(left: tuple, right: tuple) -> tuple | None:
+    """Return the most specific types which match both signatures, if any."""
+    types = []
+    for first, second in itertools.zip_longest(left, right, fillvalue=object):
+        if issubclass(first, second):
+            types.append(first)
+        elif issubclass(second, first):
+            types.append(second)
+        else:
+            return None
+    return tuple(types)
+
+
+def ambiguities(method: multimethod) -> Iterator[tuple]:
+    """Generate pairs of signatures which have no single resolution for their common types."""
+    keys = [key for key in method if isinstance(key, signature)]
+    for left, right in itertools.combinations(keys, 2):
+        types = meet(left, right)
+        if types is not None and types not in method:
+            try:
+                method.find(types)
+            except DispatchError:
+                yield left, right
+
+
+def samples(method: multimethod) -> list[tuple]:
+    """Return arguments which dispatch, from registered types which construct without arguments."""
+    args = []
+    for key in method.registered():
+        try:  # subscripted types are sampled by their origin, and empty containers match
+            params = tuple(getattr(cls, "__origin__", cls)() for cls in key)
+            method.dispatch(*params)
+        except Exception:  # arbitrary constructors, or ambiguous dispatch
+            continue
+        args.append(params)
+    return args
+
+
+def timing(func: Callable, count: int, number: int) -> float:
+    """Return the minimum time in microseconds per item of calling `func` repeatedly."""
+    return min(timeit.repeat(func, repeat=3, number=number)) / number / count * 1e6
+
+
+def cost(method: multimethod, number: int, sample: bool = False) -> str:
+    """Return the time per dispatch of sample arguments, including any instance checks.
+
+    Sampling calls the registered types, and so is only enabled on request.
+    """
+    if method.pending:  # evaluating forward references could fail
+        return "n/a (pending)"
+    if not sample:
+        return "n/a (not sampled)"
+    args = samples(method)
+    if not args:
+        return "n/a (no samples)"
+    elapsed = timing(lambda: [method.dispatch(*params) for params in args], len(args), number)
+    return f"{elapsed:.3f} us ({len(args)} samples)"
+
+
+def resolution(method: multimethod, number: int) -> str:
+    """Return the time per uncached resolution of the registered types."""
+    keys = [tuple(key) for key in method if isinstance(key, signature)]
+    if not keys:
+        return "n/a (no signatures)"
+
+    def resolve():
+        for types in keys:
+            with contextlib.suppress(DispatchError):
+                method.find(types)
+
+    return f"{timing(resolve, len(keys), max(number // 100, 1)):.3f} us"
+
+
+def describe(types: tuple) -> str:
+    return "(" + ", ".join(getattr(cls, "__name__", str(cls)) for cls in types) + ")"
+
+
+def main(args: list | None = None):
+    parser = argparse.ArgumentParser(prog="python -m multimethod", description=__doc__)
+    parser.add_argument("module", help="importable module name")
+    parser.add_argument("--number", type=int, default=10000, help="dispatches to time")
+    parser.add_argument("--sample", action="store_true", help="construct registered types to time")
+    options = parser.parse_args(args)
+    module = importlib.import_module(options.module)
+    for name, method in find(module):
+        keys = [key for key in method if isinstance(key, signature)]
+        generics = [index for index, bases in enumerate(method.generics) if bases]
+        print(f"{module.__name__}.{name}")
+        print(f"  registered: {len(keys)}, cached: {len(method) - len(keys)}")
+        pending = sorted(func.__name__ for func in method.pending)
+        print(f"  generics: {generics}, pending: {pending}")
+        for left, right in ambiguities(method):
+            print(f"  ambiguous: {describe(left)} {describe(right)}")
+        print(f"  dispatch: {cost(method, options.number, options.sample)}")
+        print(f"  resolution: {resolution(method, options.number)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from collections.abc import Iterable
 from concurrent import futures
 
@@ -130,3 +132,245 @@ def test_concurrency():
     args = [type("", (int,), {})() for _ in range(500)]
     fs = [submit(func, arg) for arg in args]
     assert all(future.result() is None for future in fs)
+
+
+def test_weak(monkeypatch):
+    @multimethod
+    def func(arg: int):
+        return int
+
+    func.weak = True
+    cls = type("", (int,), {})
+    ref = weakref.ref(cls)
+    assert func(cls()) is func(cls()) is int
+    assert len(func) == 1 and len(func.refs) == 1
+    with monkeypatch.context() as context:
+        context.setattr(multimethod, "__missing__", None)
+        assert func(cls()) is int
+    del cls
+    gc.collect()
+    assert ref() is None and not func.refs
+    assert func(0) is int
+    func[(float,)] = float
+    assert not func.refs
+    with pytest.raises(DispatchError):
+        func("")
+
+
+def test_layer():
+    @multimethod
+    def func(arg: int):
+        return int
+
+    @func.register
+    def _(arg: int, other: object):
+        return object
+
+    layer = func.layer()
+    assert layer.__name__ == "func" and layer.base is func
+
+    @layer.register
+    def _(arg: bool):
+        return bool
+
+    @layer.register
+    def _(arg: object, other: int):
+        return int
+
+    assert layer(True) is bool and func(True) is int
+    assert layer(0) is int and (int,) in func
+    assert layer(0, "") is object
+    with pytest.raises(DispatchError, match="2 methods"):
+        layer(0, 0)
+    assert func(0, 0) is object
+    assert layer[int, object] is func[int, object]
+
+    func[(float,)] = lambda arg: float
+    assert layer(0.0) is float
+    func[(list[int],)] = lambda arg: list
+    assert layer([0]) is list
+    layer[(list[int],)] = lambda arg: tuple
+    assert layer([0]) is tuple and func([0]) is list
+    del func[int, object]
+    with pytest.raises(DispatchError):
+        layer(0, "")
+
+    sublayer = layer.layer()
+    sublayer[(int,)] = lambda arg: "sub"
+    assert sublayer(0) == "sub" and sublayer(True) is bool and sublayer(0.0) is float
+    assert sublayer(1, 1) is int
+
+    dispatch = multidispatch(lambda arg: None).layer()
+    dispatch[(int,)] = lambda arg: int
+    assert dispatch(arg=0) is int and dispatch.base(0) is None
+    dispatch.base.register(str)(lambda other: str)
+    assert dispatch(other="") is str and ("other",) in dispatch.signatures
+
+    func.weak, func.peek = True, True
+    func.memoize()
+    layer = func.layer()
+    assert layer.weak and layer.peek and layer.memo is func.memo
+    layer[(str,)] = lambda arg: str
+    assert layer("") is str and layer.cache_info()
+
+
+def test_errors():
+    @multimethod
+    def func(arg: int, other: object): ...
+
+    @func.register
+    def _(arg: object, other: int): ...
+
+    for _ in range(2):
+        with pytest.raises(DispatchError, match="0 methods"):
+            func("", "")
+        with pytest.raises(DispatchError, match="2 methods") as exc:
+            func(0, 0)
+    assert exc.value.args[1] == (int, int)
+    assert set(func.errors) == {(str, str), (int, int)}
+    func[str, str] = func[int, object]
+    assert not func.errors
+    assert func("", "") is None
+
+
+def test_resolve():
+    @multimethod
+    def func(arg: int):
+        return int
+
+    handle = func.resolve(bool)
+    assert handle(True) is int
+    func[(bool,)] = lambda arg: bool
+    assert handle(True) is bool
+    assert handle.generation == func.generation
+    del func[bool,]
+    assert handle(True) is int
+    layer = func.layer()
+    handle = layer.resolve(bool)
+    func[(bool,)] = lambda arg: bool
+    assert handle(True) is bool
+    with pytest.raises(DispatchError):
+        func.resolve(str)
+    handle = func.resolve(int)
+    del func[int,]
+    for _ in range(2):
+        with pytest.raises(DispatchError):
+            handle(0)
+
+
+def test_arity():
+    @multimethod
+    def func(arg: int, *args):
+        return int
+
+    @func.register
+    def _(arg: str, other: int):
+        return str
+
+    assert func.arity == 2
+    assert func(0, 0.0, "", b"") is func(0, 0.0, None, 0) is int
+    assert len(func) == 3 and (int, float, object, object) in func
+    assert func("", 0) is str
+    with pytest.raises(DispatchError, match="0 methods"):
+        func("", 0, 0)
+    del func[str, int]
+    assert func.arity == 1 and func(0, 0) is int
+
+
+def test_memoize():
+    calls = []
+
+    @multimethod
+    def func(arg: int):
+        """int"""
+        calls.append(arg)
+        return int
+
+    @func.register
+    def _(arg: str):
+        calls.append(arg)
+        return str
+
+    func.memoize(int, maxsize=2)
+    assert func(0) is func(0) is int and func(True) is int
+    assert func("") is func("") is str
+    assert calls == [0, True, "", ""]
+    assert list(func.cache_info().values())[0].hits == 1
+    assert signature.from_hints(func[int,]) == (int,) and "int" in func.__doc__
+    func.memoize()
+    assert func("") is func("") is str and calls[-1] == ""
+    assert len(func.cache_info()) == 2
+
+    @func.register
+    def _(arg: float):
+        calls.append(arg)
+
+    func(0.5)
+    func(0.5)
+    assert calls.count(0.5) == 1
+    func.cache_clear()
+    assert all(info.currsize == 0 for info in func.cache_info().values())
+    assert len(func) == 3
+    with pytest.raises(DispatchError, match="Function"):
+        func(0, extra=None)
+    with pytest.raises(KeyError, match="no function"):
+        func.memoize(bytes)
+
+    @func.register
+    def _(arg: list):
+        calls.append(arg)
+        return list
+
+    assert func([]) is func([]) is list and calls[-2:] == [[], []]
+
+    @func.register
+    def _(arg: bytes):
+        calls.append(arg)
+        raise TypeError
+
+    with pytest.raises(DispatchError):
+        func(b"")
+    assert calls[-1] == b"" and calls.count(b"") == 1
+
+    @multimethod
+    def method(arg: int, other: int = 0):
+        return other
+
+    layer = method.layer()
+    layer.memoize(int, int)
+    assert layer(1) == 0 and layer(1, 2) == 2
+    assert hasattr(layer[int, int], "cache_clear")
+    assert not hasattr(method[int, int], "cache_clear")
+    method.memoize(int, int)
+    assert method(1) == 0 and method(1, 2) == 2
+
+
+def test_table():
+    @multimethod
+    def func(arg: int, other: object):
+        return int
+
+    @func.register
+    def _(arg: object, other: float):
+        return float
+
+    @func.register
+    def _(arg: bool, other: list[int]):
+        return list
+
+    table = func.compile_table([int, bool, float, int])
+    assert table.classes == (int, bool, float) and len(table.indices) == 9
+    assert table(0, 0) is table(True, True) is int and table(0.0, 0.0) is float
+    assert len(func) == 3  # resolved without caching
+    assert table(0, None) is int and table("", 0.0) is float
+    with pytest.raises(DispatchError, match="2 methods"):
+        table(0, 0.0)
+    assert table(True, [0]) is list
+    with pytest.raises(DispatchError, match="0 methods"):
+        table(0, 0, 0)
+    func[int, float] = lambda arg, other: "both"
+    assert table(0, 0.0) == "both"
+    assert table.generation == func.generation
+    func[int, float] = lambda arg: "both"
+    with pytest.raises(DispatchError, match="Function"):
+        table(0, 0.0)
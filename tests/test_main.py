@@ -0,0 +1,63 @@
+from multimethod.__main__ import main
+
+source = """
+from collections.abc import Iterable
+from multimethod import multimethod
+
+
+@multimethod
+def func(arg: int, other: object): ...
+
+
+@func.register
+def _(arg: object, other: int): ...
+
+
+@func.register
+def _(arg: object, other: list[int]): ...
+
+
+class cls:
+    @multimethod
+    def method(self, arg: "undefined"): ...
+
+
+class broken:
+    def __init__(self):
+        raise ValueError
+
+
+@multimethod
+def sampled(arg: broken): ...
+"""
+
+
+def test_main(tmp_path, monkeypatch, capsys):
+    (tmp_path / "audited.py").write_text(source)
+    monkeypatch.syspath_prepend(tmp_path)
+    main(["audited", "--number", "10", "--sample"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:5] == [
+        "audited.func",
+        "  registered: 3, cached: 0",
+        "  generics: [1], pending: []",
+        "  ambiguous: (int, object) (object, int)",
+        "  ambiguous: (int, object) (object, list[int])",
+    ]
+    assert lines[5].startswith("  dispatch: ") and lines[5].endswith(" us (3 samples)")
+    assert float(lines[6].split()[1]) > 0
+    assert lines[7:-1] == [
+        "audited.cls.method",
+        "  registered: 0, cached: 0",
+        "  generics: [], pending: ['method']",
+        "  dispatch: n/a (pending)",
+        "  resolution: n/a (no signatures)",
+        "audited.sampled",
+        "  registered: 1, cached: 0",
+        "  generics: [], pending: []",
+        "  dispatch: n/a (no samples)",
+    ]
+    assert lines[-1].startswith("  resolution: ")
+    main(["audited", "--number", "10"])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines.count("  dispatch: n/a (not sampled)") == 2
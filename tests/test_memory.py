@@ -0,0 +1,143 @@
+import gc
+import tracemalloc
+from collections.abc import Iterable
+
+import pytest
+
+from multimethod import multimethod, subtype
+
+
+def measure(func, count: int) -> float:
+    """Return the average number of bytes retained by each call to `func`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [func(index) for index in range(count)]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del results
+    return size / count
+
+
+@pytest.fixture
+def report(record_property):
+    """Record and print a measurement, so it's shown in the summary of passed tests."""
+
+    def record(name: str, size: float):
+        record_property(name, size)
+        print(f"{name}: {size:.1f}")
+
+    return record
+
+
+def classes(count: int) -> list:
+    return [type(f"cls{index}", (), {}) for index in range(count)]
+
+
+@pytest.mark.benchmark
+def test_signatures(report):
+    bases = classes(100)
+
+    @multimethod
+    def func(arg): ...
+
+    size = measure(lambda index: func.__setitem__((bases[index],), func[()]), len(bases))
+    report("bytes per signature", size)
+    assert len(func) == 101
+    assert size < 1536
+
+
+@pytest.mark.benchmark
+def test_cache(report):
+    objs = [cls() for cls in classes(100)]
+
+    @multimethod
+    def func(arg: object): ...
+
+    func[(int,)] = func[object,]
+    func(None)
+    size = measure(lambda index: func(objs[index]), len(objs))
+    report("bytes per cache entry", size)
+    assert len(func) == 103
+    assert size < 160
+
+
+@pytest.mark.benchmark
+def test_table(report):
+    bases = classes(30)
+
+    @multimethod
+    def func(arg: object, other: object): ...
+
+    for cls in bases[::2]:
+        func[cls, object] = func[object, object]
+    size = measure(lambda _: func.compile_table(bases), 1) / len(bases) ** 2
+    report("bytes per table entry", size)
+    assert len(func) == 16
+    assert size < 6
+
+
+@pytest.mark.benchmark
+def test_subtypes(report):
+    bases = classes(100)
+    size = measure(lambda index: subtype(list[bases[index]]), len(bases))
+    report("bytes per subtype", size)
+    assert size < 6144
+    size = measure(lambda index: issubclass(list[bases[index]], subtype(list[object])), len(bases))
+    report("bytes per subclass check", size)
+    assert size < 32
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [10, 100])
+def test_footprint(report, count):
+    bases = classes(count)
+    objs = [cls() for cls in bases]
+
+    def build(_):
+        @multimethod
+        def func(arg, other): ...
+
+        for cls in bases:
+            func[cls, object] = func[()]
+            func[object, list[cls]] = func[()]
+        for obj in objs:
+            func(obj, obj)
+        return func
+
+    shared = build(None)  # subtypes and their checks are shared by multimethods
+    size = measure(build, 1)
+    report(f"bytes per multimethod with {count} types", size)
+    assert size < 4096 * count
+    assert len(shared) == len(build(None))
+
+
+@pytest.mark.benchmark
+def test_churn(report):
+    @multimethod
+    def func(arg: list[int]): ...
+
+    @func.register
+    def _(arg: Iterable[str]): ...
+
+    def check(index):
+        cls = type(f"cls{index}", (list,), {})
+        func(cls([0]))
+        issubclass(subtype(list[cls]), subtype(Iterable[object]))
+
+    sizes = []
+    tracemalloc.start()
+    try:
+        for _ in range(4):  # bounded caches are warmed up in the first round
+            for index in range(1000):
+                check(index)
+            gc.collect()
+            sizes.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    size = (sizes[-1] - sizes[1]) / 2000
+    report("bytes per transient type", size)
+    assert size < 16
@@ -267,3 +267,53 @@ def test_dispatch_exception():
         return "optional"
 
     assert temp(True, 1.0) == "optional"
+
+
+def test_direct():
+    class cls(metaclass=multimeta):
+        def method(self, x):
+            return "OBJECT"
+
+        def other(self, x: int): ...
+
+    obj = cls()
+    assert obj.method.__func__ is cls.method.direct
+    assert cls.other.direct is None and obj.other.__func__ is cls.other
+    assert obj.method(0) == cls.method(obj, 0) == "OBJECT"
+    with pytest.raises(DispatchError):
+        cls.method(obj)
+
+    @cls.method.register
+    def _(self, x: int):
+        return "INT"
+
+    assert cls.method.direct is None
+    assert obj.method(0) == "INT"
+    del cls.method[object, int]
+    assert obj.method(0) == "OBJECT"
+
+    @multimethod
+    def func(x): ...
+
+    assert func.direct
+
+    @multimethod
+    def func(x: "undefined"): ...  # noqa: F821
+
+    assert func.direct is None
+
+
+@pytest.mark.benchmark
+def test_methods():
+    class visitor(metaclass=multimeta):
+        def visit(self, node: int):
+            return "int"
+
+        def visit(self, node: str):
+            return "str"
+
+    class subvisitor(visitor): ...
+
+    for obj in (visitor(), subvisitor()) * 100:
+        assert obj.visit(0) == "int" and obj.visit("") == "str"
+    assert set(visitor.visit) >= {(visitor, int), (subvisitor, str)}
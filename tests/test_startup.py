@@ -0,0 +1,79 @@
+import importlib.util
+from collections.abc import Iterable, Mapping
+
+import pytest
+
+import multimethod
+from multimethod import multimeta, signature
+
+
+source = """
+@decorator
+def func{0}(arg: int, other: Iterable[str], *args, key: Mapping = None): ...
+
+@decorator
+def func{0}(arg: float, other: Mapping[str, int]): ...
+"""
+codes = [compile(source.format(index), "<source>", "exec") for index in range(100)]
+
+
+def functions(decorator=lambda func: func) -> dict:
+    namespace = {"Iterable": Iterable, "Mapping": Mapping, "decorator": decorator}
+    for code in codes:  # compiled outside of the benchmarks
+        exec(code, namespace)  # the namespace is also the calling frame's locals
+    return {name: namespace[name] for name in namespace if name.startswith("func")}
+
+
+hinted = functions()
+
+
+@pytest.mark.benchmark
+def test_import():
+    spec = importlib.util.spec_from_file_location("multimethod", multimethod.__file__)
+    module = importlib.util.module_from_spec(spec)  # a separate copy which isn't in `sys.modules`
+    spec.loader.exec_module(module)
+    assert module.multimethod is not multimethod.multimethod
+
+
+@pytest.mark.benchmark
+def test_hints():
+    for func in hinted.values():
+        assert signature.from_hints(func) == signature([float, Mapping[str, int]])
+
+
+@pytest.mark.benchmark
+def test_decorate():
+    funcs = functions(multimethod.multimethod)  # including homonym lookup
+    assert all(len(func) == 2 for func in funcs.values())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [10, 100])
+def test_graph(count):
+    bases = [object]
+    for index in range(count):  # a binary tree of classes
+        bases.append(type(f"cls{index}", (bases[index // 2],), {}))
+
+    @multimethod.multimethod
+    def func(arg, other): ...
+
+    for cls in bases[1:]:
+        func[cls, object] = func[()]
+        func[object, cls] = func[()]
+    assert len(func) == 2 * count + 1
+    (key,) = (key for key in func if key == (bases[-1], object))
+    assert key.parents == {(bases[(count - 1) // 2], object)}
+
+
+@pytest.mark.benchmark
+def test_multimeta():
+    for index in range(100):
+
+        class cls(metaclass=multimeta):
+            def method(self, arg: int): ...
+
+            def method(self, arg: str): ...
+
+            def other(self, arg: Iterable[int]): ...
+
+        assert len(cls.method) == 2 and len(cls.other) == 1
@@ -1,14 +1,18 @@
+import abc
 import asyncio
+import collections
+import gc
 import inspect
+import io
 import sys
 import typing
 from array import array
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Generic, Literal, TypeVar, Union
 
 import pytest
 
-from multimethod import DispatchError, multimethod, parametric, subtype
+from multimethod import DispatchError, multidispatch, multimethod, parametric, peekable, subtype
 
 
 def matches(instance, cls):
@@ -26,6 +30,18 @@ def test_literals():
     assert not issubclass(Literal["a", 0.0], tp)
     assert not issubclass(tuple[str, int], tp)
     assert issubclass(tp, subtype(str | int))
+    assert issubclass(int, subtype(int | str))  # memoized checks aren't inherited
+    assert not issubclass(int, subtype(Literal[1, "a"]))
+
+    @multimethod
+    def method(arg: object):
+        return object
+
+    @method.register
+    def _(arg: Literal[1, "a"]):
+        return Literal
+
+    assert method[int,](5) is object and method(1) is Literal
 
     @multimethod
     def func(arg: Literal["a", 0]):
@@ -205,3 +221,138 @@ def test_parametric():
     assert matches(array("i"), ints)
     assert not matches(array("l"), ints)
     assert list(subtype.origins(ints)) == [array]
+
+
+def test_peekable():
+    assert not matches(iter([0]), subtype(Iterator[int]))
+    it = peekable(iter([0, 1]))
+    assert matches(it, subtype(Iterator[int]))
+    assert matches(it, subtype(Iterable[int]))
+    assert not matches(it, subtype(Iterator[str]))
+    assert not matches(it, subtype(list[int]))
+    assert list(it) == [0, 1]
+    assert peekable.wrap([]) == []
+    assert peekable.wrap(it) is it
+
+    @multimethod
+    def func(arg: Iterator[int], *args):
+        return "int", list(arg)
+
+    @func.register
+    def _(arg: Iterator[str], *args):
+        return "str", list(arg)
+
+    with pytest.raises(DispatchError):
+        func(iter([0]))
+    func.peek = True
+    assert func(iter([0, 1])) == ("int", [0, 1])
+    assert func(iter("ab"), None) == ("str", ["a", "b"])
+    with pytest.raises(DispatchError):
+        func(iter([]))
+    stream = io.StringIO("a")
+    assert func(iter([0]), stream) == ("int", [0]) and stream.read() == "a"
+
+    @multidispatch
+    def func(arg): ...
+
+    @func.register
+    def _(arg: Iterator[int]):
+        return sum(arg)
+
+    @func.register
+    def _(arg: Iterator[int], other: object):
+        return other
+
+    func.peek = True
+    assert func(arg=iter([1, 2])) == func(iter([1, 2])) == 3
+    assert func(iter("a")) is None
+    stream = io.StringIO("a")
+    assert func(iter([0]), stream) is func(arg=iter([0]), other=stream) is stream
+    assert stream.read() == "a"
+
+
+def test_depth():
+    values = [0j, 0.0]
+    tp = subtype(list[complex], depth=None)
+    assert matches(values, subtype(list[complex]))
+    assert tp is subtype(list[complex], None) and tp is not subtype(list[complex])
+    assert not matches(values, tp)
+    assert matches(values[:1], tp)
+    with pytest.raises(AttributeError, match="construction"):
+        tp.depth = 1
+    tp = subtype(dict[bytes, complex], depth=2)
+    assert not matches({b"": 0j, b"-": 0.0}, tp)
+    assert matches({b"": 0j, b"-": 0j}, tp)
+    assert not matches([0j, 0.0], subtype(list[complex] | tuple[complex], depth=None))
+
+    tp = subtype(tuple[complex, ...], depth=None, memo=1)
+    values = (0j,) * 3
+    assert matches(values, tp) and matches(values, tp)
+    assert list(tp.memos) == [id(values)]
+    assert not matches(values + (0.0,), tp)
+    assert len(tp.memos) == 1
+    tp = subtype(frozenset[list[complex]], memo=1)
+    assert matches(frozenset(), tp) and not hasattr(tp, "memos")
+
+    @multimethod
+    def func(arg: list[complex]):
+        return "shallow"
+
+    func[(subtype(list[complex], depth=None),)] = lambda arg: "deep"
+    assert len(func) == 2 and subtype(list[complex]) != subtype(list[complex], depth=None)
+
+
+def test_interned():
+    assert subtype(list[int]) is subtype(typing.List[int])
+    assert subtype(Literal[1]) is not subtype(Literal[1.0])
+    assert subtype(Literal[[0]]) is not subtype(Literal[[0]])
+    assert not issubclass(Literal[[0]], subtype(Literal[[1]]))
+    assert not issubclass(subtype(Literal[[0]]), subtype(Literal[[1]]))
+    assert issubclass(subtype(Literal[[0]]), subtype(Literal[[0], [1]]))
+
+    class base(abc.ABC): ...
+
+    cls = type("", (int,), {})
+    tp, sub = subtype(list[base]), subtype(list[cls])
+    assert not issubclass(sub, tp)
+    assert [result for _, result in sub.__checks__.values()] == [False]
+    base.register(cls)
+    assert issubclass(sub, tp)
+    assert [result for _, result in sub.__checks__.values()] == [True]
+    for _ in range(10):
+        base.register(type("", (int,), {}))
+        assert issubclass(sub, tp)
+    assert len(sub.__checks__) == 1
+
+    tp = subtype(Iterable[int])
+    cls = type("", (list,), {})
+    assert not issubclass(cls, tp)
+    assert list(tp.__classes__.values())[-1][1] is False
+    size = len(tp.__classes__)
+    del cls
+    gc.collect()
+    assert len(tp.__classes__) == size - 1
+
+
+def test_predicate():
+    class values(list):
+        def __next__(self): ...
+
+    class items(dict): ...
+
+    Ints, Items = subtype(list[range]), subtype(dict[range, int])
+    assert isinstance([range(0)], Ints) and not isinstance([0], Ints)
+    assert not isinstance(values([range(0)]), Ints)  # an iterator which isn't peekable
+    assert isinstance(items({range(0): 0}), Items) and not isinstance({range(0): ""}, Items)
+    assert Ints.__predicate__([]) and not Ints.__predicate__(())
+    assert isinstance(collections.Counter("ab"), subtype(collections.Counter[str]))
+
+    @multimethod
+    def func(arg: object):
+        return object
+
+    @func.register
+    def _(arg: collections.Counter[str]):
+        return str
+
+    assert func(collections.Counter("ab")) is str and func(collections.Counter([0])) is object